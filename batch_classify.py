@@ -0,0 +1,150 @@
+"""
+Batch filler/command classifier for offline transcript scoring.
+
+Transcripts are encoded as integer token ids (encode_batch) and classified
+by a single kernel (classify_batch), matching the adapter's set-based checks.
+The kernel is compiled with Numba when it is installed (optional, see
+requirements-extensions.txt); without it the kernel runs as plain Python,
+which is slow on large batches.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # the kernel then runs as (slow) plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+from .config import IGNORED_FILLERS, INTERRUPTION_TRIGGERS, _MULTI_WORD_TRIGGERS
+from .filler_aware_adapter import _extract_words
+
+
+# ----------------------------------------
+# Classification results
+# ----------------------------------------
+
+CLASS_NORMAL = 0   # Regular speech
+CLASS_FILLER = 1   # Only ignored fillers
+CLASS_COMMAND = 2  # Contains an interruption command (wins over filler)
+
+# Id for tokens that are neither fillers nor part of a trigger
+UNKNOWN_ID = -1
+
+
+# ----------------------------------------
+# Integer-encoded vocabulary (built once at import)
+# ----------------------------------------
+
+def _build_vocabulary() -> Dict[str, int]:
+    """Assigns a small int id to every known filler/trigger word."""
+    words = {w for w in IGNORED_FILLERS if " " not in w}
+    for trigger in INTERRUPTION_TRIGGERS:
+        words.update(trigger.split())
+    return {w: i for i, w in enumerate(sorted(words))}
+
+
+VOCAB: Dict[str, int] = _build_vocabulary()
+
+# Boolean masks indexed by token id
+_FILLER_IDS = np.zeros(len(VOCAB), dtype=np.bool_)
+_TRIGGER_IDS = np.zeros(len(VOCAB), dtype=np.bool_)
+for _w, _i in VOCAB.items():
+    _FILLER_IDS[_i] = _w in IGNORED_FILLERS
+    _TRIGGER_IDS[_i] = _w in INTERRUPTION_TRIGGERS
+
+# Multi-word triggers as rows of token ids, padded with UNKNOWN_ID
+_MULTI = [t.split() for t in _MULTI_WORD_TRIGGERS]
+_MULTI_WORD_IDS = np.full(
+    (len(_MULTI), max((len(t) for t in _MULTI), default=0)), UNKNOWN_ID, dtype=np.int32
+)
+_MULTI_WORD_LENS = np.array([len(t) for t in _MULTI], dtype=np.int32)
+for _row, _trigger in enumerate(_MULTI):
+    _MULTI_WORD_IDS[_row, : len(_trigger)] = [VOCAB[w] for w in _trigger]
+
+
+# ----------------------------------------
+# Encoding
+# ----------------------------------------
+
+def encode_batch(texts: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tokenizes and encodes transcripts into a flat token-id array plus
+    offsets, where utterance i spans token_ids[offsets[i]:offsets[i + 1]].
+    """
+    get = VOCAB.get
+    ids: List[int] = []
+    offsets = [0]
+    for text in texts:
+        ids.extend(get(w, UNKNOWN_ID) for w in _extract_words(text))
+        offsets.append(len(ids))
+    return np.asarray(ids, dtype=np.int32), np.asarray(offsets, dtype=np.int64)
+
+
+# ----------------------------------------
+# Kernel
+# ----------------------------------------
+
+@njit(cache=True, parallel=True)
+def _classify_kernel(token_ids, offsets, filler_ids, trigger_ids, multi_ids, multi_lens):
+    n = offsets.shape[0] - 1
+    out = np.zeros(n, dtype=np.int8)
+
+    for u in prange(n):
+        start = offsets[u]
+        end = offsets[u + 1]
+        if start == end:
+            continue
+
+        has_command = False
+        filler_only = True
+        for i in range(start, end):
+            tid = token_ids[i]
+            if tid < 0:
+                filler_only = False
+                continue
+            if trigger_ids[tid]:
+                has_command = True
+                break
+            if not filler_ids[tid]:
+                filler_only = False
+
+            # Multi-word triggers starting at this token
+            for m in range(multi_lens.shape[0]):
+                length = multi_lens[m]
+                if i + length > end:
+                    continue
+                matched = True
+                for k in range(length):
+                    if token_ids[i + k] != multi_ids[m, k]:
+                        matched = False
+                        break
+                if matched:
+                    has_command = True
+                    break
+            if has_command:
+                break
+
+        if has_command:
+            out[u] = CLASS_COMMAND
+        elif filler_only:
+            out[u] = CLASS_FILLER
+
+    return out
+
+
+def classify_batch(token_ids: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Classifies a batch of encoded utterances (see encode_batch) for offline
+    scoring. Returns one CLASS_* flag per utterance. The real-time adapter
+    keeps using the set-based checks; the confidence rule is not applied.
+    """
+    return _classify_kernel(
+        token_ids, offsets, _FILLER_IDS, _TRIGGER_IDS, _MULTI_WORD_IDS, _MULTI_WORD_LENS
+    )
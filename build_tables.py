@@ -0,0 +1,84 @@
+"""
+Precompiles the filler/trigger sets into a flat `_tables.py` module.
+
+Usage:
+    python -m extensions.build_tables
+
+The generated module holds the final (env + file + normalization expanded)
+sets as frozenset literals, together with a snapshot of the env values,
+filler-file mtimes and normalization map digest they were built from. config.py imports it when present
+and still current, so workers skip env parsing, file reads and variant
+expansion at startup; a stale snapshot is logged and config loads
+dynamically. Re-run after changing filler files, env settings or the
+normalization map; delete `_tables.py` to go back to dynamic loading.
+"""
+
+import contextlib
+import os
+
+_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_tables.py")
+
+_TEMPLATE = '''\
+# Generated by `python -m extensions.build_tables`. Do not edit.
+
+# Sources the sets were built from; config ignores the tables if these changed
+SOURCE_ENV = {env}
+SOURCE_FILES = {files}
+SOURCE_NORMALIZATION = {normalization}
+
+FILE_BASED_FILLERS = frozenset({file_fillers})
+
+IGNORED_FILLERS = frozenset({fillers})
+
+INTERRUPTION_TRIGGERS = frozenset({triggers})
+'''
+
+
+def _literal(words) -> str:
+    """Deterministic literal for a collection of strings."""
+    return repr(tuple(sorted(words)))
+
+
+def render(config) -> str:
+    env, files, normalization = config._source_snapshot(config.FILLER_DIR)
+    return _TEMPLATE.format(
+        env=repr(env),
+        files=repr(dict(sorted(files.items()))),
+        normalization=repr(normalization),
+        file_fillers=_literal(config.FILE_BASED_FILLERS),
+        fillers=_literal(config.IGNORED_FILLERS),
+        triggers=_literal(config.INTERRUPTION_TRIGGERS),
+    )
+
+
+def main() -> None:
+    # Always build from the dynamic sources, never from a previous build
+    os.environ["USE_PRECOMPILED_TABLES"] = "0"
+    from . import config
+
+    # config may have been imported (with tables) before the override
+    if config._tables is not None:
+        raise RuntimeError(
+            "config was loaded from precompiled tables; run this as a fresh "
+            "`python -m extensions.build_tables` process"
+        )
+
+    # Write next to the target and swap it in, so a concurrently starting
+    # worker never imports a half-written module
+    tmp_path = _TABLES_PATH + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(render(config))
+        os.replace(tmp_path, _TABLES_PATH)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    print(
+        f"Wrote {_TABLES_PATH} "
+        f"({len(config.IGNORED_FILLERS)} fillers, {len(config.INTERRUPTION_TRIGGERS)} triggers)"
+    )
+
+
+if __name__ == "__main__":
+    main()
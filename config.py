@@ -1,6 +1,20 @@
 import os
+import sys
 import json
-from typing import List, Set
+import hashlib
+import logging
+from collections import defaultdict
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from .normalization import NORMALIZATION_MAP
+
+# Optional (pyahocorasick, see requirements-extensions.txt)
+try:
+    import ahocorasick
+except ImportError:  # falls back to plain substring matching
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
 
 # ----------------------------------------
 # Helpers
@@ -16,30 +30,44 @@ def _get_env_list(name: str, default: List[str]) -> List[str]:
     if not env_val:
         return default
 
-    try:
-        # Check if it looks like a JSON list
-        if env_val.lstrip().startswith("["):
-            return json.loads(env_val)
-        
-        # Otherwise, parse as comma-separated
-        return list(map(str.strip, env_val.split(",")))
-    except Exception:
-        return default
+    stripped = env_val.strip()
 
+    # Looks like a JSON list
+    if stripped.startswith("["):
+        try:
+            parsed = json.loads(stripped)
+        except json.JSONDecodeError as e:
+            logger.warning("Invalid JSON list in %s, using defaults: %s", name, e)
+            return default
 
-def _load_words_from_file(path: str) -> Set[str]:
+        # A leading "[" always parses to a list, but its items may be anything
+        if not all(isinstance(x, str) for x in parsed):
+            logger.warning("%s is not a JSON list of strings, using defaults", name)
+            return default
+        return parsed
+
+    # Otherwise, parse as comma-separated
+    return [s.strip() for s in env_val.split(",") if s.strip()]
+
+
+def _iter_words_from_file(path: str) -> Iterator[str]:
     """
-    Loads a set of words from a text file, one word/phrase per line.
+    Yields words from a text file, one word/phrase per line.
+    A file that cannot be read or decoded yields nothing.
     """
-    if not os.path.exists(path):
-        return set()
-
     try:
+        # Read fully first so a decode error midway drops the whole file.
+        # Split on "\n" only: splitlines() would also break on \v, \f,
+        # \x1c-\x1e, \x85, \u2028 and \u2029.
         with open(path, "r", encoding="utf-8") as f:
-            # Use a set comprehension for efficient loading
-            return {line.strip().lower() for line in f if line.strip()}
+            lines = f.read().split("\n")
     except Exception:
-        return set()
+        return
+
+    for line in lines:
+        word = line.strip()
+        if word:
+            yield word.lower()
 
 
 def _load_all_from_directory(folder: str) -> Set[str]:
@@ -50,14 +78,33 @@ def _load_all_from_directory(folder: str) -> Set[str]:
     if not os.path.isdir(folder):
         return all_words
 
-    for filename in os.listdir(folder):
-        if filename.endswith(".txt"):
-            filepath = os.path.join(folder, filename)
-            all_words.update(_load_words_from_file(filepath))
+    with os.scandir(folder) as it:
+        files = [entry.path for entry in it if entry.name.endswith(".txt")]
 
+    # Stream every file straight into one accumulator set
+    all_words.update(w for p in files for w in _iter_words_from_file(p))
     return all_words
 
 
+# Canonical form -> every surface variant that normalizes to it
+_INVERSE_NORMALIZATION: Dict[str, Set[str]] = defaultdict(set)
+for _variant, _canonical in NORMALIZATION_MAP.items():
+    _INVERSE_NORMALIZATION[_canonical].add(_variant)
+
+
+def _expand_variants(words: AbstractSet[str]) -> Set[str]:
+    """
+    Adds the canonical form and every normalization variant of each word,
+    so raw lowercased tokens can be matched without normalizing them.
+    """
+    expanded = set(words)
+    for w in words:
+        canonical = NORMALIZATION_MAP.get(w, w)
+        expanded.add(canonical)
+        expanded.update(_INVERSE_NORMALIZATION.get(canonical, ()))
+    return expanded
+
+
 # ----------------------------------------
 # File-based filler loading
 # ----------------------------------------
@@ -67,7 +114,77 @@ FILLER_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "filler_words")
 )
 
-FILE_BASED_FILLERS = _load_all_from_directory(FILLER_DIR)
+
+# ----------------------------------------
+# Precompiled tables
+# ----------------------------------------
+
+# Env vars baked into the precompiled tables
+_TABLE_ENV_VARS = ("IGNORED_FILLERS", "INTERRUPT_COMMANDS")
+
+
+def _source_snapshot(
+    folder: str,
+) -> Tuple[Dict[str, Optional[str]], Dict[str, float], str]:
+    """
+    Returns the env values, filler-file mtimes and normalization map digest
+    the sets are built from. Stored in the precompiled tables to detect
+    when they go stale.
+    """
+    env = {name: os.getenv(name) for name in _TABLE_ENV_VARS}
+    files: Dict[str, float] = {}
+    if os.path.isdir(folder):
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.endswith(".txt"):
+                    files[entry.name] = entry.stat().st_mtime
+    normalization = hashlib.sha256(
+        repr(sorted(NORMALIZATION_MAP.items())).encode("utf-8")
+    ).hexdigest()
+    return env, files, normalization
+
+
+def _load_precompiled_tables():
+    """
+    Imports the tables written by `python -m extensions.build_tables`, so
+    startup skips env parsing, file reads and variant expansion. Returns
+    None when not built, disabled (USE_PRECOMPILED_TABLES=0), broken or stale.
+    """
+    if os.getenv("USE_PRECOMPILED_TABLES", "1") == "0":
+        return None
+
+    try:
+        from . import _tables
+    except ImportError:
+        return None
+    except Exception as e:
+        # e.g. a truncated or hand-edited file; never let it break startup
+        logger.warning("Failed to import precompiled filler tables, loading dynamically: %s", e)
+        return None
+
+    snapshot = (
+        getattr(_tables, "SOURCE_ENV", None),
+        getattr(_tables, "SOURCE_FILES", None),
+        getattr(_tables, "SOURCE_NORMALIZATION", None),
+    )
+    if snapshot != _source_snapshot(FILLER_DIR):
+        logger.warning(
+            "Precompiled filler tables are stale (env, filler files or normalization "
+            "changed), loading dynamically; re-run `python -m extensions.build_tables`"
+        )
+        return None
+
+    logger.info("Using precompiled filler tables from %s", _tables.__file__)
+    return _tables
+
+
+_tables = _load_precompiled_tables()
+
+# File-based fillers, taken from the tables when they are current
+if _tables is not None:
+    FILE_BASED_FILLERS = set(_tables.FILE_BASED_FILLERS)
+else:
+    FILE_BASED_FILLERS = _load_all_from_directory(FILLER_DIR)
 
 
 # ----------------------------------------
@@ -78,11 +195,20 @@ DEFAULT_FILLERS_ENV = [
     "uh", "umm", "hmm", "haan", "okay", "hmm okay"
 ]
 
-# Load fillers from environment, then merge with file-based fillers
-env_fillers = {
-    w.lower() for w in _get_env_list("IGNORED_FILLERS", DEFAULT_FILLERS_ENV)
-}
-IGNORED_FILLERS: Set[str] = env_fillers.union(FILE_BASED_FILLERS)
+# Load fillers from environment, then merge with file-based fillers.
+# The final sets are frozen and their strings interned for fast lookups.
+# They are fixed once imported: the trigger automaton and partitions below
+# are derived from them at import, and the adapter copies the names via
+# `from .config import`, so rebinding these attributes has no effect.
+if _tables is not None:
+    IGNORED_FILLERS: FrozenSet[str] = frozenset(map(sys.intern, _tables.IGNORED_FILLERS))
+else:
+    env_fillers = {
+        w.lower() for w in _get_env_list("IGNORED_FILLERS", DEFAULT_FILLERS_ENV)
+    }
+    IGNORED_FILLERS = frozenset(
+        sys.intern(w) for w in _expand_variants(env_fillers | FILE_BASED_FILLERS)
+    )
 
 
 # ----------------------------------------
@@ -91,9 +217,45 @@ IGNORED_FILLERS: Set[str] = env_fillers.union(FILE_BASED_FILLERS)
 
 DEFAULT_INTERRUPTS_ENV = ["stop", "wait", "hold on", "pause"]
 
-INTERRUPTION_TRIGGERS: Set[str] = {
-    w.lower() for w in _get_env_list("INTERRUPT_COMMANDS", DEFAULT_INTERRUPTS_ENV)
-}
+if _tables is not None:
+    INTERRUPTION_TRIGGERS: FrozenSet[str] = frozenset(
+        map(sys.intern, _tables.INTERRUPTION_TRIGGERS)
+    )
+else:
+    INTERRUPTION_TRIGGERS = frozenset(
+        sys.intern(w)
+        for w in _expand_variants({
+            w.lower() for w in _get_env_list("INTERRUPT_COMMANDS", DEFAULT_INTERRUPTS_ENV)
+        })
+    )
+
+
+def _build_trigger_automaton(triggers: AbstractSet[str]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Builds an Aho-Corasick automaton over all triggers (single- and multi-word).
+    Each trigger is padded with spaces so it only matches on word boundaries
+    of a space-padded, space-joined token string.
+    """
+    if ahocorasick is None or not triggers:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for trigger in triggers:
+        automaton.add_word(f" {trigger} ", trigger)
+    automaton.make_automaton()
+    return automaton
+
+
+# None when pyahocorasick is not installed
+_TRIGGER_AC = _build_trigger_automaton(INTERRUPTION_TRIGGERS)
+
+# Triggers partitioned once, for matching without the automaton
+_MULTI_WORD_TRIGGERS = tuple(t for t in INTERRUPTION_TRIGGERS if " " in t)
+_SINGLE_WORD_TRIGGERS = frozenset(t for t in INTERRUPTION_TRIGGERS if " " not in t)
+
+# Multi-word triggers padded with spaces, for word-boundary matching
+# against space-padded joined text
+_PADDED_MULTI_WORD_TRIGGERS = tuple(f" {t} " for t in _MULTI_WORD_TRIGGERS)
 
 
 # ----------------------------------------
@@ -108,4 +270,10 @@ AGENT_SPEAKING_CONFIDENCE_THRESHOLD = float(
 # Max number of tokens for a segment to be considered "short"
 SHORT_SEGMENT_TOKEN_LIMIT = int(
     os.getenv("SHORT_SEGMENT_TOKENS", "5")
-)
\ No newline at end of file
+)
+
+# Window (ms) within which consecutive interim transcripts are coalesced,
+# forwarding only the latest one. 0 disables coalescing.
+INTERIM_COALESCE_MS = int(
+    os.getenv("INTERIM_COALESCE_MS", "20")
+)
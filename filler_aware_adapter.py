@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import Callable, List
+from typing import Callable, List, Optional
 from livekit.agents.stt import (
     STT,
     RecognizeStream,
@@ -15,35 +15,77 @@ from livekit import rtc
 # Use the new config variable names
 from .config import (
     IGNORED_FILLERS,
-    INTERRUPTION_TRIGGERS,
     AGENT_SPEAKING_CONFIDENCE_THRESHOLD,
     SHORT_SEGMENT_TOKEN_LIMIT,
+    INTERIM_COALESCE_MS,
+    _TRIGGER_AC,
+    _PADDED_MULTI_WORD_TRIGGERS,
+    _SINGLE_WORD_TRIGGERS,
 )
 
 
 # ---------------------------- Helpers ----------------------------
 
-# Regex to find word-like tokens
+# Regex to find word-like tokens (used for non-ASCII text)
 _TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 
+# ASCII translation table: folds case and maps every non-word char to a space,
+# so ASCII text can be tokenized with a single translate() + split()
+_XLATE = {
+    c: (chr(c).lower() if chr(c).isalnum() or chr(c) == "_" else " ")
+    for c in range(0x80)
+}
+
 def _extract_words(text: str) -> List[str]:
     """Splits text into lowercase words."""
-    return [w.lower() for w in _TOKEN_RE.findall(text or "")]
+    if not text:
+        return []
+    if text.isascii():
+        return text.translate(_XLATE).split()
+    return [w.lower() for w in _TOKEN_RE.findall(text)]
 
 def _is_filler_only(words: List[str]) -> bool:
     """Checks if a list of words contains only ignored fillers."""
+    # A plain frozenset probe (C-level, cached str hash) already beats any
+    # Python-level prefilter such as a Bloom filter, even for large sets.
     return bool(words) and all(w in IGNORED_FILLERS for w in words)
 
-def _has_interrupt_command(words: List[str]) -> bool:
-    """Checks if a list of words contains an interruption command."""
-    text = " ".join(words)
-    
-    # Check for multi-word commands first
-    if any(cmd in text for cmd in INTERRUPTION_TRIGGERS if " " in cmd):
-        return True
-    
+# Whether _has_interrupt_command needs the joined text at all
+_NEEDS_JOINED = _TRIGGER_AC is not None or bool(_PADDED_MULTI_WORD_TRIGGERS)
+
+def _join_padded(words: List[str]) -> str:
+    """Joins words with spaces, padded so every word is space-delimited."""
+    return " %s " % " ".join(words)
+
+def _has_interrupt_command(words: List[str], joined: Optional[str] = None) -> bool:
+    """
+    Checks if a list of words contains an interruption command.
+    `joined` is the _join_padded text, computed here if not passed in.
+    """
+    if _TRIGGER_AC is not None:
+        # Single linear pass over the padded text, independent of trigger count
+        if joined is None:
+            joined = _join_padded(words)
+        return any(True for _ in _TRIGGER_AC.iter(joined))
+
     # Check for single-word commands
-    return any(w in INTERRUPTION_TRIGGERS for w in words)
+    if not _SINGLE_WORD_TRIGGERS.isdisjoint(words):
+        return True
+
+    # Check for multi-word commands (skip the join when there are none)
+    if not _PADDED_MULTI_WORD_TRIGGERS:
+        return False
+    if joined is None:
+        joined = _join_padded(words)
+    return any(cmd in joined for cmd in _PADDED_MULTI_WORD_TRIGGERS)
+
+
+# Event types that carry a transcript and are subject to filtering
+_TRANSCRIPT_TYPES = frozenset({
+    SpeechEventType.INTERIM_TRANSCRIPT,
+    SpeechEventType.PREFLIGHT_TRANSCRIPT,
+    SpeechEventType.FINAL_TRANSCRIPT,
+})
 
 
 # ---------------------------- Adapter ----------------------------
@@ -111,45 +153,130 @@ class _FillerStream(RecognizeStream):
         self._base = wrapped_stream
         self._is_agent_speaking = is_agent_speaking
 
+        # Latest not-yet-forwarded interim transcript and its flush timer
+        self._pending_interim: Optional[SpeechEvent] = None
+        self._interim_timer: Optional[asyncio.TimerHandle] = None
+        # Error raised while flushing from the timer, re-raised by _run
+        self._interim_error: Optional[BaseException] = None
+
+        # Last classified transcript while the agent is speaking
+        self._last_text: Optional[str] = None
+        self._last_confidence = 0.0
+        self._last_ignore = False
+
+    # Input is forwarded synchronously to the wrapped stream (which does its
+    # own resampling) instead of through _input_ch and a forwarding task.
+
+    def push_frame(self, frame: rtc.AudioFrame) -> None:
+        """Push audio to be recognized"""
+        self._check_input_not_ended()
+        self._check_not_closed()
+        self._base.push_frame(frame)
+
+    def flush(self) -> None:
+        """Mark the end of the current segment"""
+        self._check_input_not_ended()
+        self._check_not_closed()
+        self._base.flush()
+
+    def end_input(self) -> None:
+        """Mark the end of input, no more audio will be pushed"""
+        self._check_input_not_ended()
+        self._check_not_closed()
+        self._base.end_input()
+        self._input_ch.close()
+
+    async def aclose(self) -> None:
+        """Close this stream and the wrapped one, even if _run never started."""
+        await super().aclose()
+        await self._base.aclose()
+
     async def _run(self):
-        """Main task for processing audio and speech events."""
-        
-        # Task to forward input audio frames to the wrapped stream
-        async def _forward_input():
-            async for frame_or_flush in self._input_ch:
-                if isinstance(frame_or_flush, rtc.AudioFrame):
-                    self._base.push_frame(frame_or_flush)
-                else:
-                    self._base.flush()
-            self._base.end_input()
-
-        forward_task = asyncio.create_task(_forward_input())
+        """Main task for processing speech events."""
+        loop = asyncio.get_running_loop()
+        coalesce_s = INTERIM_COALESCE_MS / 1000
 
         try:
             # Process events from the wrapped stream
             async with self._base:
                 async for event in self._base:
-                    filtered_event = self._filter_event(event)
-                    if filtered_event is not None:
-                        self._event_ch.send_nowait(filtered_event)
+                    if coalesce_s > 0 and event.type == SpeechEventType.INTERIM_TRANSCRIPT:
+                        # Keep only the latest interim within the window
+                        self._pending_interim = event
+                        if self._interim_timer is None:
+                            self._interim_timer = loop.call_later(
+                                coalesce_s, self._on_interim_timer
+                            )
+                        continue
+
+                    # Any other event flushes the pending interim first to keep ordering
+                    self._flush_pending_interim()
+                    self._send_filtered(event)
+        except asyncio.CancelledError:
+            # Cancelled by _on_interim_timer: fail the stream with its error
+            if self._interim_error is not None:
+                raise self._interim_error from None
+            raise
         finally:
-            await forward_task
+            self._flush_pending_interim()
+
+    def _on_interim_timer(self):
+        """
+        Timer callback flushing the pending interim. It runs outside _run, so
+        an exception (e.g. from the agent-speaking check) would only reach
+        the loop's exception handler; hand it to _run instead.
+        """
+        self._interim_timer = None
+        try:
+            self._flush_pending_interim()
+        except Exception as e:
+            self._interim_error = e
+            self._task.cancel()
+
+    def _flush_pending_interim(self):
+        """Forwards the pending interim transcript, if any."""
+        if self._interim_timer is not None:
+            self._interim_timer.cancel()
+            self._interim_timer = None
+
+        event, self._pending_interim = self._pending_interim, None
+        if event is not None:
+            self._send_filtered(event)
+
+    def _send_filtered(self, event: SpeechEvent):
+        filtered_event = self._filter_event(event)
+        if filtered_event is not None:
+            self._event_ch.send_nowait(filtered_event)
 
     # -------------------- Core Filtering Logic --------------------
 
-    def _filter_event(self, event: SpeechEvent):
+    def _filter_event(
+        self,
+        event: SpeechEvent,
+        # Hot-path globals bound as defaults for fast local access
+        _TT=_TRANSCRIPT_TYPES,
+        _extract=_extract_words,
+        _ff=_is_filler_only,
+        _hic=_has_interrupt_command,
+        _join=_join_padded,
+        _NJ=_NEEDS_JOINED,
+        _TH=AGENT_SPEAKING_CONFIDENCE_THRESHOLD,
+        _LIM=SHORT_SEGMENT_TOKEN_LIMIT,
+    ):
         """
         Applies the filtering logic to a single speech event.
         Returns the event if it should be kept, or None if suppressed.
         (Note: We return the event and set a flag to avoid suppression).
         """
-        
+
         # 1. Always keep non-transcript events
-        if event.type not in {
-            SpeechEventType.INTERIM_TRANSCRIPT,
-            SpeechEventType.PREFLIGHT_TRANSCRIPT,
-            SpeechEventType.FINAL_TRANSCRIPT,
-        }:
+        if event.type not in _TT:
+            return event
+
+        # 2. Agent is NOT speaking? Keep everything.
+        # Checked before tokenizing since this is the common case.
+        if not self._is_agent_speaking():
+            self._last_text = None  # Speaking state flipped, drop the cache
             return event
 
         if not event.alternatives:
@@ -157,33 +284,40 @@ class _FillerStream(RecognizeStream):
 
         alt = event.alternatives[0]
         text = alt.text or ""
-        words = _extract_words(text)
 
-        if not words:
+        # Interim transcripts often repeat: reuse the last decision
+        if text == self._last_text and alt.confidence == self._last_confidence:
+            if self._last_ignore:
+                event._ignore_interruption = True  # Suppress interruption
             return event
 
-        # 2. Agent is NOT speaking? Keep everything.
-        if not self._is_agent_speaking():
+        words = _extract(text)
+
+        if not words:
             return event
 
         # 3. Agent IS speaking. Apply suppression rules.
 
         # Rule A: Commands (e.g., "stop") always interrupt.
-        if _has_interrupt_command(words):
-            return event  # Allow interruption
+        joined = _join(words) if _NJ else None
+        if _hic(words, joined):
+            ignore = False  # Allow interruption
 
         # Rule B: Pure filler (e.g., "uh", "umm") should NOT interrupt.
-        if _is_filler_only(words):
-            event._ignore_interruption = True  # Suppress interruption
-            return event
+        elif _ff(words):
+            ignore = True
 
         # Rule C: Low-confidence short segments should NOT interrupt.
-        is_low_confidence = alt.confidence and alt.confidence < AGENT_SPEAKING_CONFIDENCE_THRESHOLD
-        is_short = len(words) <= SHORT_SEGMENT_TOKEN_LIMIT
-        
-        if is_low_confidence and is_short:
-            event._ignore_interruption = True  # Suppress interruption
-            return event
-
         # 4. Default: Non-filler, non-command speech interrupts normally.
-        return event
\ No newline at end of file
+        else:
+            is_low_confidence = alt.confidence and alt.confidence < _TH
+            is_short = len(words) <= _LIM
+            ignore = bool(is_low_confidence and is_short)
+
+        self._last_text = text
+        self._last_confidence = alt.confidence
+        self._last_ignore = ignore
+
+        if ignore:
+            event._ignore_interruption = True  # Suppress interruption
+        return event
@@ -1,6 +1,10 @@
+import asyncio
+import logging
 import os
 import time
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class FillerManager:
@@ -17,7 +21,8 @@ class FillerManager:
         self.last_loaded_time = 0
         self.fillers: Set[str] = set()
         self.commands: Set[str] = set()
-        self._file_cache: Dict[str, float] = {}  # Caches file modification times
+        # Caches (mtime, parsed words, is_command) per file path
+        self._file_cache: Dict[str, Tuple[float, Set[str], bool]] = {}
 
         if not os.path.isdir(directory):
             raise FileNotFoundError(f"Filler directory not found: {directory}")
@@ -28,11 +33,11 @@ class FillerManager:
     # File Helpers
     # -----------------------------------------
 
-    def _load_words_from_file(self, path: str) -> Set[str]:
-        """Loads a set of words from a single text file."""
-        if not os.path.exists(path):
-            return set()
-
+    def _load_words_from_file(self, path: str) -> Optional[Set[str]]:
+        """
+        Loads a set of words from a single text file.
+        Returns None if the file could not be read.
+        """
         try:
             with open(path, "r", encoding="utf-8") as f:
                 return {
@@ -41,41 +46,24 @@ class FillerManager:
                     if line.strip()
                 }
         except Exception as e:
-            print(f"Error reading filler file {path}: {e}")
-            return set()
+            logger.error("Error reading filler file %s: %s", path, e)
+            return None
 
-    def _has_file_changes(self) -> bool:
+    def _scan_directory(self) -> List[Tuple[str, float, str]]:
         """
-        Returns True if any .txt file in the directory has been
-        modified, added, or removed since the last check.
+        Returns (path, mtime, name) for every .txt file in the directory,
+        using a single os.scandir() pass.
         """
-        files_updated = False
-        current_files = set()
-
-        for fname in os.listdir(self.directory):
-            if not fname.endswith(".txt"):
-                continue
-
-            path = os.path.join(self.directory, fname)
-            current_files.add(path)
-            
-            try:
-                mtime = os.path.getmtime(path)
-            except FileNotFoundError:
-                continue
-
-            if path not in self._file_cache or mtime > self._file_cache[path]:
-                self._file_cache[path] = mtime
-                files_updated = True
-
-        # Check for deleted files
-        if set(self._file_cache.keys()) != current_files:
-            self._file_cache = {
-                p: t for p, t in self._file_cache.items() if p in current_files
-            }
-            files_updated = True
-
-        return files_updated
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".txt"):
+                    continue
+                try:
+                    entries.append((entry.path, entry.stat().st_mtime, entry.name))
+                except FileNotFoundError:
+                    continue
+        return entries
 
     # -----------------------------------------
     # Main Reload Logic
@@ -83,36 +71,66 @@ class FillerManager:
 
     def reload_if_changed(self):
         """
-        Reloads all filler and command files if any
-        file modification is detected.
+        Reloads filler and command lists if any file was modified,
+        added, or removed since the last check. Only files whose
+        mtime changed are re-read; the rest come from the cache.
         """
-        if not self._has_file_changes() and self.last_loaded_time > 0:
-            return  # No update needed
-
-        print("[FillerManager] Detected changes, reloading word lists...")
-        new_fillers = set()
-        new_commands = set()
-
-        for fname in os.listdir(self.directory):
-            if not fname.endswith(".txt"):
+        entries = self._scan_directory()
+        changed = len(entries) != len(self._file_cache)
+        new_cache: Dict[str, Tuple[float, Set[str], bool]] = {}
+
+        for path, mtime, fname in entries:
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                new_cache[path] = cached
                 continue
 
-            path = os.path.join(self.directory, fname)
+            changed = True
             words = self._load_words_from_file(path)
+            if words is None:
+                continue  # Not cached, so it is retried on the next reload
+            new_cache[path] = (mtime, words, "command" in fname.lower())
+
+        if not changed and self.last_loaded_time > 0:
+            return  # No update needed
 
-            if "command" in fname.lower():
-                new_commands.update(words)
-            else:
-                new_fillers.update(words)
+        logger.info("Detected changes, reloading word lists...")
 
-        self.fillers = new_fillers
-        self.commands = new_commands
+        # Removed files are dropped simply by not being carried over
+        self._file_cache = new_cache
+        self.fillers = set().union(
+            *(words for _, words, is_command in new_cache.values() if not is_command)
+        )
+        self.commands = set().union(
+            *(words for _, words, is_command in new_cache.values() if is_command)
+        )
         self.last_loaded_time = time.time()
 
-        print(
-            f"[FillerManager] Reloaded. Fillers: {len(self.fillers)}, Commands: {len(self.commands)}"
+        logger.info(
+            "Reloaded. Fillers=%d Commands=%d", len(self.fillers), len(self.commands)
         )
 
+    async def reload_if_changed_async(self):
+        """
+        Runs reload_if_changed in a worker thread so file IO never
+        blocks the event loop. reload_if_changed stays sync for startup.
+        """
+        await asyncio.to_thread(self.reload_if_changed)
+
+    async def watch(self, interval: float = 2.0):
+        """
+        Polls the directory for changes every `interval` seconds.
+        Not started automatically: the caller must run it as a background
+        task (e.g. asyncio.create_task(manager.watch())), off the STT path.
+        Transient filesystem errors are logged and polling continues.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload_if_changed_async()
+            except OSError as e:
+                logger.warning("Failed to reload filler lists from %s: %s", self.directory, e)
+
     # -----------------------------------------
     # Query Helpers
     # -----------------------------------------
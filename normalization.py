@@ -46,10 +46,11 @@ def normalize_speech_tokens(words: List[str]) -> List[str]:
     - Map variants to canonical form
     """
 
-    # Use a list comprehension for a clean, fast transformation
+    # Bind the lookup locally to skip the attribute lookup in the loop
+    get = NORMALIZATION_MAP.get
     return [
-        NORMALIZATION_MAP.get(cleaned_word, cleaned_word)
+        get(cleaned_word, cleaned_word)
         for cleaned_word in (
             w.lower().strip(STRIP_CHARS) for w in words
         )
-    ]
\ No newline at end of file
+    ]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+# the filler extension lives at the repo root and is deployed as the `extensions` package
+EXTENSION_DIR = Path(__file__).resolve().parent.parent
+
+
+def _ensure_package() -> None:
+    if "extensions" not in sys.modules:
+        pkg = types.ModuleType("extensions")
+        pkg.__path__ = [str(EXTENSION_DIR)]
+        sys.modules["extensions"] = pkg
+
+
+def import_extension(name: str) -> types.ModuleType:
+    _ensure_package()
+    return importlib.import_module(f"extensions.{name}")
+
+
+def load_extension_copy(name: str) -> types.ModuleType:
+    """Executes a fresh copy of an extension module, leaving sys.modules untouched."""
+    _ensure_package()
+    spec = importlib.util.spec_from_file_location(
+        f"extensions.{name}", EXTENSION_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
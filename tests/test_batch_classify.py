@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from .extension_utils import import_extension
+
+bc = import_extension("batch_classify")
+fa = import_extension("filler_aware_adapter")
+config = import_extension("config")
+
+_CASES = [
+    "uh umm",  # filler-only
+    "stop",  # single-word trigger
+    "please stop talking",
+    "hold on",  # multi-word trigger
+    "uh hold on",
+    "hold hold on",
+    "on hold",  # reversed, must not match
+    "uh umm wait",  # trigger mixed with fillers
+    "tell me more",  # unknown words
+    "uh tell me",
+    "",
+]
+
+
+def _adapter_classes(texts: list[str]) -> list[int]:
+    classes = []
+    for text in texts:
+        words = fa._extract_words(text)
+        if fa._has_interrupt_command(words):
+            classes.append(bc.CLASS_COMMAND)
+        elif fa._is_filler_only(words):
+            classes.append(bc.CLASS_FILLER)
+        else:
+            classes.append(bc.CLASS_NORMAL)
+    return classes
+
+
+def _batch_classes(texts: list[str]) -> list[int]:
+    return bc.classify_batch(*bc.encode_batch(texts)).tolist()
+
+
+@pytest.fixture(autouse=True)
+def _default_tables():
+    # the cases assume the default filler and trigger sets
+    assert {"uh", "umm"} <= config.IGNORED_FILLERS
+    assert {"stop", "wait", "hold on"} <= config.INTERRUPTION_TRIGGERS
+
+
+def test_batch_matches_adapter():
+    assert _batch_classes(_CASES) == _adapter_classes(_CASES)
+    assert _batch_classes(["on hold", "hold hold on"]) == [bc.CLASS_NORMAL, bc.CLASS_COMMAND]
+
+
+def test_batch_matches_adapter_without_multi_word_triggers(monkeypatch):
+    monkeypatch.setattr(fa, "_TRIGGER_AC", None)
+    monkeypatch.setattr(fa, "_PADDED_MULTI_WORD_TRIGGERS", ())
+    monkeypatch.setattr(bc, "_MULTI_WORD_IDS", np.full((0, 0), bc.UNKNOWN_ID, dtype=np.int32))
+    monkeypatch.setattr(bc, "_MULTI_WORD_LENS", np.zeros(0, dtype=np.int32))
+
+    assert _batch_classes(_CASES) == _adapter_classes(_CASES)
+    assert _batch_classes(["hold on"]) == [bc.CLASS_NORMAL]
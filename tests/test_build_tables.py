@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from .extension_utils import EXTENSION_DIR
+
+# Reports which path config took, run in a fresh interpreter each time
+_PROBE = "from extensions import config; print(config._tables is not None)"
+
+
+@pytest.fixture
+def package(tmp_path):
+    # isolated copy of the extension, so the built tables never touch the repo
+    pkg = tmp_path / "extensions"
+    pkg.mkdir()
+    for name in ("build_tables.py", "config.py", "normalization.py"):
+        shutil.copy(EXTENSION_DIR / name, pkg / name)
+    (pkg / "filler_words").mkdir()
+    (pkg / "filler_words" / "english.txt").write_text("uh\nhmm\n", encoding="utf-8")
+    return pkg
+
+
+def _run(package, *args: str, **env: str) -> subprocess.CompletedProcess:
+    full_env = {
+        k: v
+        for k, v in os.environ.items()
+        if k not in ("IGNORED_FILLERS", "INTERRUPT_COMMANDS", "USE_PRECOMPILED_TABLES")
+    }
+    full_env.update(env)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=package.parent,
+        env=full_env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _uses_tables(package, **env: str) -> bool:
+    return _run(package, "-c", _PROBE, **env).stdout.strip() == "True"
+
+
+def _build(package, **env: str) -> None:
+    _run(package, "-m", "extensions.build_tables", **env)
+    assert (package / "_tables.py").is_file()
+    assert not (package / "_tables.py.tmp").exists()
+
+
+def test_fresh_tables_are_used(package):
+    assert not _uses_tables(package)  # not built yet
+    _build(package, IGNORED_FILLERS="umm")
+    assert _uses_tables(package, IGNORED_FILLERS="umm")
+
+
+def test_disabled_tables_are_ignored(package):
+    _build(package)
+    assert not _uses_tables(package, USE_PRECOMPILED_TABLES="0")
+
+
+def test_stale_env_loads_dynamically(package):
+    _build(package, IGNORED_FILLERS="umm")
+    assert not _uses_tables(package, IGNORED_FILLERS="umm,haan")
+    assert not _uses_tables(package)
+
+
+def test_stale_filler_file_loads_dynamically(package):
+    _build(package)
+    path = package / "filler_words" / "english.txt"
+    mtime = path.stat().st_mtime + 10
+    os.utime(path, (mtime, mtime))
+    assert not _uses_tables(package)
+
+    (package / "filler_words" / "hindi.txt").write_text("accha\n", encoding="utf-8")
+    _build(package)
+    assert _uses_tables(package)
+    (package / "filler_words" / "hindi.txt").unlink()
+    assert not _uses_tables(package)
+
+
+def test_stale_normalization_loads_dynamically(package):
+    _build(package)
+    with open(package / "normalization.py", "a", encoding="utf-8") as f:
+        f.write('\nNORMALIZATION_MAP["hmmm"] = "hmm"\n')
+    assert not _uses_tables(package)
+
+
+def test_broken_tables_load_dynamically(package):
+    _build(package)
+    tables = package / "_tables.py"
+    text = tables.read_text(encoding="utf-8")
+    # cut off mid-literal, as an interrupted in-place write would
+    tables.write_text(text[: text.index("frozenset(") + 10], encoding="utf-8")
+
+    probe = _run(package, "-c", _PROBE)
+    assert probe.stdout.strip() == "False"
+    assert "Failed to import precompiled filler tables" in probe.stderr
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from livekit.agents.stt import SpeechData, SpeechEvent, SpeechEventType
+
+from .extension_utils import import_extension
+from .fake_stt import FakeSTT
+
+fa = import_extension("filler_aware_adapter")
+fa_config = import_extension("config")
+
+
+async def _collect(stream) -> list[tuple[SpeechEventType, str]]:
+    return [(ev.type, ev.alternatives[0].text) async for ev in stream]
+
+
+async def _open_stream(agent_speaking=lambda: True):
+    stt = FakeSTT()
+    adapter = fa.FillerAwareAdapter(stt, agent_speaking)
+    stream = adapter.stream()
+    base = await stt.stream_ch.recv()
+    return adapter, stream, base
+
+
+async def test_interims_coalesce_to_latest(monkeypatch):
+    monkeypatch.setattr(fa, "INTERIM_COALESCE_MS", 50)
+    adapter, stream, base = await _open_stream()
+
+    for text in ("one", "one two", "one two three"):
+        base.send_fake_transcript(text, is_final=False)
+
+    await asyncio.sleep(0.2)  # let the coalescing window elapse
+    stream.end_input()
+
+    assert await _collect(stream) == [
+        (SpeechEventType.INTERIM_TRANSCRIPT, "one two three"),
+    ]
+    await adapter.aclose()
+
+
+async def test_final_flushes_pending_interim_first(monkeypatch):
+    monkeypatch.setattr(fa, "INTERIM_COALESCE_MS", 10_000)
+    adapter, stream, base = await _open_stream()
+
+    base.send_fake_transcript("hel", is_final=False)
+    base.send_fake_transcript("hello", is_final=False)
+    base.send_fake_transcript("hello there", is_final=True)
+    stream.end_input()
+
+    assert await _collect(stream) == [
+        (SpeechEventType.INTERIM_TRANSCRIPT, "hello"),
+        (SpeechEventType.FINAL_TRANSCRIPT, "hello there"),
+    ]
+    await adapter.aclose()
+
+
+async def test_coalescing_disabled_passes_every_event(monkeypatch):
+    monkeypatch.setattr(fa, "INTERIM_COALESCE_MS", 0)
+    adapter, stream, base = await _open_stream()
+
+    for text in ("a", "a b", "a b c"):
+        base.send_fake_transcript(text, is_final=False)
+    base.send_fake_transcript("a b c d", is_final=True)
+    stream.end_input()
+
+    assert await _collect(stream) == [
+        (SpeechEventType.INTERIM_TRANSCRIPT, "a"),
+        (SpeechEventType.INTERIM_TRANSCRIPT, "a b"),
+        (SpeechEventType.INTERIM_TRANSCRIPT, "a b c"),
+        (SpeechEventType.FINAL_TRANSCRIPT, "a b c d"),
+    ]
+    await adapter.aclose()
+
+
+async def test_end_of_stream_flushes_pending_interim(monkeypatch):
+    monkeypatch.setattr(fa, "INTERIM_COALESCE_MS", 10_000)
+    adapter, stream, base = await _open_stream()
+
+    base.send_fake_transcript("still", is_final=False)
+    base.send_fake_transcript("still talking", is_final=False)
+    stream.end_input()
+
+    events = await asyncio.wait_for(_collect(stream), timeout=5.0)
+    assert events == [(SpeechEventType.INTERIM_TRANSCRIPT, "still talking")]
+    await adapter.aclose()
+
+
+async def test_timer_flush_error_fails_stream(monkeypatch):
+    monkeypatch.setattr(fa, "INTERIM_COALESCE_MS", 10)
+
+    def agent_speaking() -> bool:
+        raise RuntimeError("speaking check failed")
+
+    adapter, stream, base = await _open_stream(agent_speaking)
+    base.send_fake_transcript("uh", is_final=False)
+
+    with pytest.raises(RuntimeError, match="speaking check failed"):
+        await asyncio.wait_for(_collect(stream), timeout=5.0)
+    await adapter.aclose()
+
+
+def _transcript(text: str, confidence: float) -> SpeechEvent:
+    return SpeechEvent(
+        type=SpeechEventType.INTERIM_TRANSCRIPT,
+        alternatives=[SpeechData(language="en", text=text, confidence=confidence)],
+    )
+
+
+def _not_called(text: str):
+    pytest.fail("transcript was re-tokenized instead of using the cached decision")
+
+
+async def test_repeated_transcript_reuses_cached_decision():
+    adapter, stream, _ = await _open_stream()
+
+    first = stream._filter_event(_transcript("uh umm", 0.9))
+    assert first._ignore_interruption is True
+
+    # same text and confidence: the cached decision is applied without tokenizing
+    repeat = stream._filter_event(_transcript("uh umm", 0.9), _extract=_not_called)
+    assert repeat._ignore_interruption is True
+    stream.end_input()
+    await _collect(stream)
+    await adapter.aclose()
+
+
+async def test_confidence_change_reclassifies():
+    adapter, stream, _ = await _open_stream()
+
+    confident = stream._filter_event(_transcript("tell me more", 0.9))
+    assert not getattr(confident, "_ignore_interruption", False)
+
+    # low-confidence short segment: must not reuse the previous decision
+    unsure = stream._filter_event(_transcript("tell me more", 0.1))
+    assert unsure._ignore_interruption is True
+    stream.end_input()
+    await _collect(stream)
+    await adapter.aclose()
+
+
+async def test_agent_not_speaking_clears_cache():
+    speaking = True
+    adapter, stream, _ = await _open_stream(lambda: speaking)
+
+    stream._filter_event(_transcript("uh umm", 0.9))
+    assert stream._last_text == "uh umm"
+
+    speaking = False
+    event = stream._filter_event(_transcript("uh umm", 0.9))
+    assert not getattr(event, "_ignore_interruption", False)
+    assert stream._last_text is None
+    stream.end_input()
+    await _collect(stream)
+    await adapter.aclose()
+
+
+_TRIGGERS = frozenset({"stop", "hold on"})
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def matcher(request, monkeypatch):
+    # pin the trigger tables so both matching paths see the same triggers
+    if request.param == "automaton":
+        automaton = fa_config._build_trigger_automaton(_TRIGGERS)
+        if automaton is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        automaton = None
+    monkeypatch.setattr(fa, "_TRIGGER_AC", automaton)
+    monkeypatch.setattr(fa, "_SINGLE_WORD_TRIGGERS", frozenset({"stop"}))
+    monkeypatch.setattr(fa, "_PADDED_MULTI_WORD_TRIGGERS", (" hold on ",))
+    return fa._has_interrupt_command
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("stop", True),
+        ("please stop now", True),
+        ("hold on", True),
+        ("uh hold on a sec", True),
+        ("behold online", False),
+        ("unstoppable", False),
+        ("on hold", False),
+        ("hold", False),
+        ("", False),
+    ],
+)
+def test_has_interrupt_command(matcher, text, expected):
+    words = fa._extract_words(text)
+    assert matcher(words) is expected
+    assert matcher(words, fa._join_padded(words)) is expected
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from .extension_utils import import_extension, load_extension_copy
+
+config = import_extension("config")
+
+
+def test_file_words_split_on_newlines_only(tmp_path):
+    path = tmp_path / "fillers.txt"
+    path.write_text("uh\r\nhmm\x85okay\n\n  Umm  \n", encoding="utf-8")
+    assert list(config._iter_words_from_file(str(path))) == ["uh", "hmm\x85okay", "umm"]
+
+
+def test_undecodable_file_yields_nothing(tmp_path):
+    path = tmp_path / "fillers.txt"
+    path.write_bytes(b"uh\n\xff\xfe\n")
+    assert list(config._iter_words_from_file(str(path))) == []
+
+
+def test_expand_variants_adds_canonical_and_siblings():
+    assert config._expand_variants({"okk"}) == {"okk", "okay", "ok", "okayyy"}
+    assert config._expand_variants({"elephant"}) == {"elephant"}
+
+
+def test_configured_sets_are_expanded(monkeypatch):
+    monkeypatch.setenv("USE_PRECOMPILED_TABLES", "0")
+    monkeypatch.setenv("IGNORED_FILLERS", "Umm,okay")
+    monkeypatch.setenv("INTERRUPT_COMMANDS", '["Stop", "hold on"]')
+    fresh = load_extension_copy("config")
+
+    # "um", "ummm", "ok", "okk" and "okayyy" become fillers without being configured
+    expected = {"umm", "um", "ummm", "okay", "ok", "okk", "okayyy"}
+    assert fresh.IGNORED_FILLERS == expected | fresh._expand_variants(fresh.FILE_BASED_FILLERS)
+    assert fresh.INTERRUPTION_TRIGGERS == {"stop", "hold on"}
+
+
+def test_env_list_parsing(monkeypatch):
+    default = ["uh"]
+    for value, expected in [
+        ('["hmm", "okay"]', ["hmm", "okay"]),
+        ("hmm, okay,,", ["hmm", "okay"]),
+        ("[1, 2]", default),
+        ('["hmm", null]', default),
+        ("[hmm", default),
+        ("", default),
+    ]:
+        monkeypatch.setenv("TEST_FILLERS", value)
+        assert config._get_env_list("TEST_FILLERS", default) == expected, value
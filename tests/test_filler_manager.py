@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from .extension_utils import import_extension
+
+fm = import_extension("filler_manager")
+
+
+def _write(path, text: str, mtime: float) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def counting_manager(tmp_path, monkeypatch):
+    _write(tmp_path / "english.txt", "uh\numm\n", 1_000)
+    _write(tmp_path / "commands.txt", "stop\n", 1_000)
+
+    reads: list[str] = []
+    load = fm.FillerManager._load_words_from_file
+
+    def counting_load(self, path):
+        reads.append(os.path.basename(path))
+        return load(self, path)
+
+    monkeypatch.setattr(fm.FillerManager, "_load_words_from_file", counting_load)
+    manager = fm.FillerManager(str(tmp_path))
+    assert sorted(reads) == ["commands.txt", "english.txt"]
+    reads.clear()
+    return manager, reads
+
+
+def test_unchanged_files_are_not_reread(counting_manager):
+    manager, reads = counting_manager
+    manager.reload_if_changed()
+    assert reads == []
+    assert manager.fillers == {"uh", "umm"}
+    assert manager.commands == {"stop"}
+
+
+def test_only_modified_file_is_reread(counting_manager, tmp_path):
+    manager, reads = counting_manager
+    _write(tmp_path / "english.txt", "hmm\n", 2_000)
+
+    manager.reload_if_changed()
+    assert reads == ["english.txt"]
+    assert manager.fillers == {"hmm"}
+    assert manager.commands == {"stop"}
+
+
+def test_removed_file_is_dropped(counting_manager, tmp_path):
+    manager, reads = counting_manager
+    (tmp_path / "commands.txt").unlink()
+
+    manager.reload_if_changed()
+    assert reads == []
+    assert manager.fillers == {"uh", "umm"}
+    assert manager.commands == set()
+
+
+def test_swapped_file_is_reread(counting_manager, tmp_path):
+    manager, reads = counting_manager
+    # replaced atomically, as editors and deploy tools do
+    _write(tmp_path / "english.new", "haan\n", 3_000)
+    os.replace(tmp_path / "english.new", tmp_path / "english.txt")
+
+    manager.reload_if_changed()
+    assert reads == ["english.txt"]
+    assert manager.fillers == {"haan"}
+
+
+def test_failed_load_is_retried(counting_manager, tmp_path):
+    manager, reads = counting_manager
+    (tmp_path / "hindi.txt").write_bytes(b"\xff\xfe not utf-8")
+    os.utime(tmp_path / "hindi.txt", (4_000, 4_000))
+
+    manager.reload_if_changed()
+    assert reads == ["hindi.txt"]
+    assert manager.fillers == {"uh", "umm"}
+
+    # fixed without touching the mtime: still retried since it was never cached
+    _write(tmp_path / "hindi.txt", "accha\n", 4_000)
+    manager.reload_if_changed()
+    assert reads == ["hindi.txt", "hindi.txt"]
+    assert manager.fillers == {"uh", "umm", "accha"}
+
+
+async def test_watch_keeps_polling_after_os_error(tmp_path, monkeypatch):
+    manager = fm.FillerManager(str(tmp_path))
+    calls = 0
+    done = asyncio.Event()
+
+    def flaky_reload():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise PermissionError("directory not readable")
+        done.set()
+
+    monkeypatch.setattr(manager, "reload_if_changed", flaky_reload)
+    task = asyncio.create_task(manager.watch(interval=0))
+    try:
+        await asyncio.wait_for(done.wait(), timeout=5.0)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert calls == 2